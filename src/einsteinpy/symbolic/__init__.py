@@ -7,7 +7,7 @@ from .ricci import RicciScalar, RicciTensor
 from .riemann import RiemannCurvatureTensor
 from .schouten import SchoutenTensor
 from .stress_energy_momentum import StressEnergyMomentumTensor
-from .tensor import BaseRelativityTensor, Tensor
+from .tensor import BaseRelativityTensor, NumericTensor, Tensor
 from .vacuum_metrics import SchwarzschildMetric
 from .vector import GenericVector
 from .weyl import WeylTensor
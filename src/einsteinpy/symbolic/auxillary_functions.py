@@ -1,3 +1,4 @@
+import multiprocessing
 import warnings
 
 import sympy
@@ -16,7 +17,22 @@ def _flatten_list(seq):
     return _flatten_list(seq[0]) + _flatten_list(seq[1:])
 
 
-def simplify_sympy_array(arr):
+def simplify_sympy_array(arr, parallel=False):
+    # components simplify independently, so with parallel=True they are
+    # spread over a process pool (sympy holds the GIL, threads would not
+    # help); processes are forked where available to avoid re-importing
+    # sympy, but every expression is still pickled per task, so expect a
+    # memory cost proportional to the pool size for large tensors
     flattened_list = _flatten_list(arr.tolist())
-    simplified_flattened_list = [sympy.simplify(e) for e in flattened_list]
-    return sympy.Array(simplified_flattened_list, arr.shape)
+    # identical components — ubiquitous in tensors with index symmetries —
+    # are simplified once and shared
+    unique = list(dict.fromkeys(flattened_list))
+    if parallel and len(unique) > 1:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ctx.Pool() as pool:
+            simplified_unique = pool.map(sympy.simplify, unique)
+    else:
+        simplified_unique = [sympy.simplify(e) for e in unique]
+    simplified = dict(zip(unique, simplified_unique))
+    return sympy.Array([simplified[e] for e in flattened_list], arr.shape)
@@ -191,7 +191,9 @@ class RicciScalar(BaseRelativityTensor):
             arr=arr, syms=syms, config="", parent_metric=parent_metric
         )
         self._order = 0
-        self._expr = sum(self.arr)  # sympy not allowing indexing, temporary fix!
+        # scalars are stored as bare expressions; rank-0 arrays still
+        # need the iteration workaround as sympy does not allow indexing
+        self._expr = self.arr if isinstance(self.arr, sympy.Expr) else sum(self.arr)
 
     @property
     def expr(self):
@@ -1,20 +1,21 @@
+import functools
+import itertools
+import weakref
+
 import numpy as np
 import sympy
-from sympy import simplify, tensorcontraction, tensorproduct
 from sympy.core.expr import Expr
 from sympy.core.function import AppliedUndef, UndefinedFunction
+from sympy.printing.numpy import NumPyPrinter
 
+from einsteinpy.ijit import jit
 from einsteinpy.symbolic.auxillary_functions import simplify_sympy_array
 
 
 def _config_checker(config):
-    # check if the string for config contains 'u' and 'l' only
-    if not isinstance(config, str):
-        return False
-    for ch in config:
-        if (not ch == "l") and (not ch == "u"):
-            return False
-    return True
+    # check if the string for config contains 'u' and 'l' only;
+    # str.strip is C-implemented, no per-character Python loop
+    return isinstance(config, str) and config.strip("lu") == ""
 
 
 def _difference_list(newconfig, oldconfig):
@@ -30,38 +31,137 @@ def _difference_list(newconfig, oldconfig):
     return difflist
 
 
-def _change_config(tensor, metric, newconfig):
+@functools.lru_cache(maxsize=None)
+def _tensor_indices(shape):
+    # every component index tuple for a given shape; depends only on the
+    # shape, so it is memoized at module level instead of being rebuilt
+    # once per raised/lowered index
+    return tuple(itertools.product(*[range(s) for s in shape]))
+
+
+@functools.lru_cache(maxsize=None)
+def _axis_contraction_kernel(shape, axis):
+    # generate straight-line code contracting a matrix with one axis of a
+    # tensor of this exact shape; specialised for the common GR case of
+    # rank <= 4 in 4-D space-time, where unrolling removes all generic
+    # index bookkeeping from the inner loop
+    lines = ["def _kernel(met, t, new_t):"]
+    for index in _tensor_indices(shape):
+        p = index[axis]
+        terms = " + ".join(
+            "met[{}, {}]*t[{}]".format(
+                p, q, ", ".join(map(str, index[:axis] + (q,) + index[axis + 1 :]))
+            )
+            for q in range(shape[axis])
+        )
+        lines.append("    new_t[{}] = {}".format(", ".join(map(str, index)), terms))
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_kernel"]
+
+
+def _change_config_numeric(tensor, metric, newconfig):
+    # raise/lower indices of a purely numeric tensor with plain numpy
+    # contractions; returns None when a component cannot be coerced to
+    # float (e.g. unevaluated functions), signalling the symbolic path
+    if not (tensor.arr.atoms(sympy.Float) or metric.arr.atoms(sympy.Float)):
+        # exact components (Integers, Rationals) would be degraded to
+        # float64-derived Floats; keep them on the exact symbolic path
+        return None
+    try:
+        t = np.array(tensor.tensor().tolist(), dtype=float)
+        lower = metric.lower_config()
+        met_dict = {
+            -1: np.array(lower.tensor().tolist(), dtype=float),
+            1: np.array(lower.inv().tensor().tolist(), dtype=float),
+        }
+    except (TypeError, ValueError):
+        return None
+    difflist = _difference_list(newconfig, tensor.config)
+    for i, action in enumerate(difflist):
+        if action == 0:
+            continue
+        # tensordot emits the raised/lowered axis first; moveaxis is a
+        # zero-copy view, so no permutation pass is actually paid here
+        t = np.tensordot(met_dict[action], t, axes=(1, i))
+        t = np.moveaxis(t, 0, i)
+    return sympy.Array(t)
+
+
+# memoized results of _change_config, keyed on the identities of the
+# participating tensors; entries are evicted once either object is
+# garbage collected so that ids cannot be silently reused
+_change_config_cache = dict()
+
+
+def _change_config(tensor, metric, newconfig, simplify=True, parallel=False):
     # check length and validity of new configuration
     if not (len(newconfig) == len(tensor.config) and _config_checker(newconfig)):
         raise ValueError
 
-    # seperate the contravariant & covariant metric tensors
+    cache_key = (id(tensor), id(metric), tensor.config, newconfig, simplify)
+    if cache_key in _change_config_cache:
+        return _change_config_cache[cache_key][0]
+
+    # fast path: purely numeric tensors do not need the sympy
+    # simplification pipeline at all
+    if tensor._is_numeric and metric._is_numeric:
+        result = _change_config_numeric(tensor, metric, newconfig)
+        if result is not None:
+            return result
+
+    # seperate the contravariant & covariant metric tensors;
+    # lower_config is resolved once and reused for its inverse
+    lower = metric.lower_config()
     met_dict = {
-        -1: metric.lower_config().tensor(),
-        1: metric.lower_config().inv().tensor(),
+        -1: lower.tensor(),
+        1: lower.inv().tensor(),
     }
 
     # main code
     def chain_config_change():
-        t = sympy.Array(tensor.tensor())
+        # tensor() already yields a sympy Array; re-wrapping it would
+        # re-traverse every component
+        t = tensor.tensor()
         difflist = _difference_list(newconfig, tensor.config)
         for i, action in enumerate(difflist):
             if action == 0:
                 continue
+            met = met_dict[action]
+            dim = t.shape[i]
+            # contract the metric with the i-th axis directly,
+            # without materialising the rank-(k+2) outer product
+            new_t = sympy.MutableDenseNDimArray.zeros(*t.shape)
+            if len(t.shape) <= 4 and dim <= 4:
+                # the common GR case runs through an unrolled kernel
+                _axis_contraction_kernel(tuple(t.shape), i)(met, t, new_t)
             else:
-                t = simplify(
-                    tensorcontraction(tensorproduct(met_dict[action], t), (1, 2 + i))
-                )
-                # reshuffle the indices
-                tmp = np.array(t.tolist()).reshape(t.shape)
-                source, dest = list(range(len(t.shape))), list(range(len(t.shape)))
-                dest.pop(i)
-                dest.insert(0, i)
-                tmp = np.moveaxis(tmp, source, dest)
-                t = sympy.Array(tmp)
-        return t
+                for index in _tensor_indices(tuple(t.shape)):
+                    p = index[i]
+                    new_t[index] = sum(
+                        met[p, q] * t[index[:i] + (q,) + index[i + 1 :]]
+                        for q in range(dim)
+                        if met[p, q] != 0  # metric is symmetric and usually sparse
+                    )
+            t = new_t
+        # simplify once at the end instead of once per contracted index;
+        # callers chaining several index operations may opt out and
+        # simplify exactly once themselves
+        if simplify:
+            return simplify_sympy_array(t, parallel=parallel)
+        return sympy.Array(t)
 
-    return chain_config_change()
+    result = chain_config_change()
+
+    def _evict(ref, key=cache_key):
+        _change_config_cache.pop(key, None)
+
+    _change_config_cache[cache_key] = (
+        result,
+        weakref.ref(tensor, _evict),
+        weakref.ref(metric, _evict),
+    )
+    return result
 
 
 class Tensor:
@@ -89,12 +189,20 @@ class Tensor:
 
         """
 
-        if isinstance(arr, (list, tuple, np.ndarray, int, float, Expr)):
+        self._scalar_arr = None
+        if isinstance(arr, (int, float, Expr)):
+            # scalars stay bare sympy expressions; the rank-0 Array wrap
+            # is built lazily by tensor() only when actually needed
+            self.arr = sympy.sympify(arr)
+            config = ""
+        elif isinstance(arr, (list, tuple, np.ndarray)):
             self.arr = sympy.Array(arr)
         elif isinstance(arr, sympy.Array):
             self.arr = arr
         else:
             raise TypeError("Only multi-dimensional list or Sympy Array is expected")
+        # numeric tensors can skip the symbolic pipelines entirely
+        self._is_numeric = not self.arr.free_symbols
         if _config_checker(config):
             self._config = config
             self._order = len(config)
@@ -120,8 +228,37 @@ class Tensor:
         return self._config
 
     def __getitem__(self, index):
+        if self._scalar_stored():
+            return self.tensor()[index]
         return self.arr[index]
 
+    def _scalar_stored(self):
+        # True when the components live in a bare sympy expression
+        # rather than an Array
+        return isinstance(self.arr, Expr)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        if not self._config == other._config:
+            return False
+        if isinstance(self.arr, np.ndarray) or isinstance(other.arr, np.ndarray):
+            return np.array_equal(self.arr, other.arr)
+        return self.arr == other.arr
+
+    def __hash__(self):
+        # structural hash so that reconstructed-but-identical tensors land
+        # in the same cache slots; identity is the fallback when the
+        # components are not hashable
+        try:
+            return hash((self._config, self.arr))
+        except TypeError:
+            if isinstance(self.arr, np.ndarray):
+                return hash((self._config, self.arr.shape, self.arr.tobytes()))
+            return object.__hash__(self)
+
     def __str__(self):
         """
         Returns a String with a readable representation of the object of class Tensor
@@ -148,8 +285,12 @@ class Tensor:
         -------
         ~sympy.tensor.array.dense_ndim_array.ImmutableDenseNDimArray
             Sympy Array object
-        
+
         """
+        if self._scalar_stored():
+            if self._scalar_arr is None:
+                self._scalar_arr = sympy.Array(self.arr)
+            return self._scalar_arr
         return self.arr
 
     def subs(self, *args):
@@ -177,13 +318,115 @@ class Tensor:
         Returns
         -------
         ~einsteinpy.symbolic.tensor.Tensor
-            Simplified Tensor
+            Simplified Tensor with the same index configuration
 
         """
-        # return sympy.simplify(self.tensor())  # this used to work with older sympy versions
+        return Tensor(self._simplified_array(), self._config)
+
+    def _simplified_array(self):
+        # component-wise simplification of the stored components
+        if self._scalar_stored():
+            return sympy.simplify(self.arr)
         return simplify_sympy_array(self.tensor())
 
 
+class NumericTensor(Tensor):
+    """
+    Inherits from ~einsteinpy.symbolic.tensor.Tensor .
+    Tensor backed by a contiguous float64 numpy array instead of a sympy Array.
+    Intended for purely numeric work (e.g. evaluating a lambdified metric on a grid)
+    where symbolic dispatch per component would dominate the runtime.
+    """
+
+    def __init__(self, arr, config="ll"):
+        """
+        Constructor and Initializer
+
+        Parameters
+        ----------
+        arr : ~numpy.ndarray or list
+            Numpy array or multi-dimensional list containing numeric values
+        config : str
+            Configuration of contravariant and covariant indices in tensor. 'u' for upper and 'l' for lower indices. Defaults to 'll'.
+
+        Raises
+        ------
+        ValueError
+            Raised when arr contains values that cannot be coerced to float
+        TypeError
+            Raised when config is not of type str or contains characters other than 'l' or 'u'
+
+        """
+        self.arr = np.ascontiguousarray(arr, dtype=np.float64)
+        self._is_numeric = True
+        if _config_checker(config):
+            self._config = config
+            self._order = len(config)
+        else:
+            raise TypeError(
+                "config is either not of type 'str' or does contain characters other than 'l' or 'u'"
+            )
+
+    def tensor(self):
+        """
+        Returns the numpy array
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Numpy array object
+
+        """
+        return self.arr
+
+    def change_config(self, newconfig, metric):
+        """
+        Changes the index configuration(contravariant/covariant)
+
+        Parameters
+        ----------
+        newconfig : str
+            Specify the new configuration.
+        metric : ~einsteinpy.symbolic.tensor.NumericTensor or ~numpy.ndarray
+            Numeric metric tensor in 'll' or 'uu' configuration to raise/lower indices with.
+
+        Returns
+        -------
+        ~einsteinpy.symbolic.tensor.NumericTensor
+            New tensor with new configuration.
+
+        """
+        if not (len(newconfig) == len(self.config) and _config_checker(newconfig)):
+            raise ValueError
+        met = metric.arr if isinstance(metric, Tensor) else np.asarray(metric)
+        if getattr(metric, "config", "ll") == "uu":
+            met = np.linalg.inv(met)
+        met_dict = {-1: met, 1: np.linalg.inv(met)}
+        t = self.arr
+        difflist = _difference_list(newconfig, self.config)
+        for i, action in enumerate(difflist):
+            if action == 0:
+                continue
+            t = np.moveaxis(np.tensordot(met_dict[action], t, axes=(1, i)), 0, i)
+        return NumericTensor(t, config=newconfig)
+
+    def subs(self, *args):
+        """
+        Substitution is not defined for numeric tensors
+
+        """
+        raise NotImplementedError(
+            "NumericTensor holds no symbols to substitute; use Tensor instead"
+        )
+
+    def simplify(self):
+        """
+        Returns the tensor unchanged as numeric components need no simplification
+
+        """
+        return self
+
+
 class BaseRelativityTensor(Tensor):
     """
     Inherits from ~einsteinpy.symbolic.tensor.Tensor . 
@@ -257,6 +500,7 @@ class BaseRelativityTensor(Tensor):
         # Cannot implement the check that parent metric belongs to the class MetricTensor
         # Due to the issue of cyclic imports, would find a workaround
         self._parent_metric = parent_metric
+        self._lambdify_cache = dict()
         self.name = name
         if isinstance(syms, (list, tuple)):
             self.syms = syms
@@ -267,21 +511,24 @@ class BaseRelativityTensor(Tensor):
         if isinstance(variables, (list, tuple, set)) and isinstance(
             functions, (list, tuple, set)
         ):
-            # compute free variables and functions if list if empty
+            # compute free variables and functions if list if empty;
+            # a single walk of the expression tree replaces the separate
+            # free_symbols and atoms() scans
+            if not variables or not functions:
+                vars_set, funcs_set = set(), set()
+                syms_set = set(self.syms)
+                for node in sympy.preorder_traversal(self.arr):
+                    if isinstance(node, sympy.Symbol):
+                        if node not in syms_set:
+                            vars_set.add(node)
+                    elif isinstance(node, (AppliedUndef, UndefinedFunction)):
+                        funcs_set.add(node)
             if not variables:
-                self.variables = [
-                    v for v in self.arr.free_symbols if v not in self.syms
-                ]
-                self.variables.sort(key=(lambda var: var.name))
+                self.variables = sorted(vars_set, key=(lambda var: var.name))
             else:
                 self.variables = list(variables)
             if not functions:
-                self.functions = [
-                    f
-                    for f in self.arr.atoms(AppliedUndef).union(
-                        self.arr.atoms(UndefinedFunction)
-                    )
-                ]
+                self.functions = list(funcs_set)
             else:
                 self.functions = list(functions)
 
@@ -309,7 +556,58 @@ class BaseRelativityTensor(Tensor):
         """
         return self.syms
 
-    def tensor_lambdify(self, *args):
+    def simplify(self):
+        """
+        Returns a simplified tensor, preserving the space-time symbols,
+        parent metric and the other associated attributes
+
+        Returns
+        -------
+        ~einsteinpy.symbolic.tensor.BaseRelativityTensor
+            Simplified Tensor
+
+        """
+        return BaseRelativityTensor(
+            self._simplified_array(),
+            syms=self.syms,
+            config=self._config,
+            parent_metric=self.parent_metric,
+            variables=self.variables,
+            functions=self.functions,
+            name=self.name,
+        )
+
+    def _lambdify_numba(self, arg_list):
+        # generate a flat kernel that fills a preallocated float array,
+        # one statement per component, and hand it to numba through
+        # einsteinpy.ijit (identity decorator when numba is missing)
+        printer = NumPyPrinter()
+        safe_syms = {
+            s: sympy.Symbol("_arg_{}".format(k)) for k, s in enumerate(arg_list)
+        }
+        # tensor() rebuilds the rank-0 Array for scalar-stored tensors
+        arr = self.tensor()
+        flat = [arr[idx] for idx in _tensor_indices(tuple(arr.shape))]
+        source = ["def _kernel({}):".format(", ".join(str(s) for s in safe_syms.values()))]
+        source.append("    _out = numpy.empty({})".format(len(flat)))
+        for k, component in enumerate(flat):
+            source.append(
+                "    _out[{}] = {}".format(
+                    k, printer.doprint(sympy.sympify(component).xreplace(safe_syms))
+                )
+            )
+        source.append("    return _out")
+        namespace = {"numpy": np}
+        exec("\n".join(source), namespace)
+        kernel = jit(namespace["_kernel"])
+        shape = arr.shape
+
+        def lambdified(*values):
+            return np.asarray(kernel(*values)).reshape(shape)
+
+        return lambdified
+
+    def tensor_lambdify(self, *args, backend="numpy"):
         """
         Returns lambdified function of symbolic tensors.
         This means that the returned functions can accept numerical values and return numerical quantities.
@@ -321,6 +619,12 @@ class BaseRelativityTensor(Tensor):
                 The returned function accepts arguments in same order as initially defined in ``*args``.
                 Uses sympy symbols from class attributes ``syms`` and ``variables`` (in the same order) if no ``*args`` is passed
                 Leaving ``*args`` empty is recommended.
+            backend : str
+                Either 'numpy' (default) or 'numba'.
+                The 'numba' backend JIT-compiles the componentwise evaluation for
+                repeated calls in hot loops (e.g. geodesic integration); the tensor
+                components must only contain functions numba can compile.
+                Silently behaves like a plain Python kernel when numba is not installed.
 
         Returns
         -------
@@ -332,12 +636,68 @@ class BaseRelativityTensor(Tensor):
         """
 
         if len(args) == 0:
-            numeric_arr = sympy.lambdify([*self.syms, *self.variables], self.arr, np)
             arg_list = (*self.syms, *self.variables)
         else:
-            numeric_arr = sympy.lambdify(args, self.arr, np)
             arg_list = tuple(args)
-        return arg_list, numeric_arr
+        # lambdify parses and compiles the whole array every call;
+        # cache per (backend, argument tuple) so hot loops pay it only once
+        cache_key = (backend, arg_list)
+        if cache_key not in self._lambdify_cache:
+            if backend == "numba":
+                numeric_arr = self._lambdify_numba(arg_list)
+            else:
+                numeric_arr = sympy.lambdify(arg_list, self.arr, np)
+            self._lambdify_cache[cache_key] = numeric_arr
+        return arg_list, self._lambdify_cache[cache_key]
+
+    def tensor_lambdify_vectorized(self, *args):
+        """
+        Returns a lambdified function evaluating the tensor on a batch of points at once.
+        Arguments are passed as parallel numpy arrays of length ``N`` (one array per symbol,
+        not a Python loop over points), amortizing the per-call overhead of the
+        point-by-point function returned by ``tensor_lambdify``.
+
+        Parameters
+        ----------
+            *args
+                The variable number of arguments accept sympy symbols.
+                Same semantics as in ``tensor_lambdify``; leaving ``*args`` empty is recommended.
+
+        Returns
+        -------
+            tuple
+                arguments to be passed in the returned function in exact order.
+            function
+                Function accepting one numpy array of shape ``(N,)`` per argument
+                and returning an array of shape ``(N, *tensor_shape)``.
+
+        """
+
+        if len(args) == 0:
+            arg_list = (*self.syms, *self.variables)
+        else:
+            arg_list = tuple(args)
+        cache_key = ("vectorized", arg_list)
+        if cache_key not in self._lambdify_cache:
+            # tensor() rebuilds the rank-0 Array for scalar-stored tensors
+            arr = self.tensor()
+            shape = tuple(arr.shape)
+            flat = [arr[idx] for idx in _tensor_indices(shape)]
+            # lambdifying the flat component list keeps numpy ufunc
+            # broadcasting per component, so one call covers all N points
+            f_flat = sympy.lambdify(arg_list, flat, np)
+
+            def vectorized(*values):
+                values = [np.asarray(v, dtype=float) for v in values]
+                n = len(values[0]) if values else 1
+                components = f_flat(*values)
+                out = np.empty((n, len(components)), dtype=float)
+                for k, component in enumerate(components):
+                    out[:, k] = component
+                return out.reshape((n,) + shape)
+
+            self._lambdify_cache[cache_key] = vectorized
+        return arg_list, self._lambdify_cache[cache_key]
 
     def lorentz_transform(self, transformation_matrix):
         """
@@ -357,16 +717,23 @@ class BaseRelativityTensor(Tensor):
         tm = sympy.Array(transformation_matrix)
         t = self.tensor()
         for i in range(self.order):
-            if self.config[i] == "u":
-                t = simplify(tensorcontraction(tensorproduct(tm, t), (1, 2 + i)))
-            else:
-                t = simplify(tensorcontraction(tensorproduct(tm, t), (0, 2 + i)))
-            tmp = np.array(t.tolist()).reshape(t.shape)
-            source, dest = list(range(len(t.shape))), list(range(len(t.shape)))
-            dest.pop(i)
-            dest.insert(0, i)
-            tmp = np.moveaxis(tmp, source, dest)
-            t = sympy.Array(tmp)
+            dim = t.shape[i]
+            # contract the transformation matrix with the i-th axis in
+            # place, never materialising the rank-(k+2) outer product
+            new_t = sympy.MutableDenseNDimArray.zeros(*t.shape)
+            for index in _tensor_indices(tuple(t.shape)):
+                p = index[i]
+                if self.config[i] == "u":
+                    row = (tm[p, q] for q in range(dim))
+                else:
+                    row = (tm[q, p] for q in range(dim))
+                new_t[index] = sum(
+                    m_pq * t[index[:i] + (q,) + index[i + 1 :]]
+                    for q, m_pq in enumerate(row)
+                    if m_pq != 0
+                )
+            t = new_t
+        t = simplify_sympy_array(t)
 
         return BaseRelativityTensor(
             t,
@@ -4,7 +4,13 @@ from numpy.testing import assert_allclose
 from sympy import Array, Function, cos, simplify, sin, symbols
 from sympy.abc import y, z
 
-from einsteinpy.symbolic import BaseRelativityTensor, MetricTensor, Tensor
+from einsteinpy.symbolic import (
+    BaseRelativityTensor,
+    MetricTensor,
+    NumericTensor,
+    Tensor,
+    simplify_sympy_array,
+)
 
 
 def schwarzschild_tensor():
@@ -61,6 +67,9 @@ def test_Tensor():
     assert obj1.tensor() == obj2.tensor()
     assert isinstance(obj1.tensor(), Array)
     assert obj1.simplify()[0, 1, 1] == 0
+    # simplify preserves the tensor type and index configuration
+    assert isinstance(obj1.simplify(), Tensor)
+    assert obj1.simplify().config == obj1.config
 
 
 def test_Tensor_getitem():
@@ -167,6 +176,46 @@ def test_tensor_scalar(scalar):
     assert scalar_tensor.tensor().rank() == 0
 
 
+def test_simplify_sympy_array_parallel():
+    z = symbols("z")
+    arr = Array(
+        [[sin(2 * z) - 2 * sin(z) * cos(z), z], [z ** 2, cos(2 * z) + 2 * sin(z) ** 2]]
+    )
+    assert simplify_sympy_array(arr, parallel=True) == simplify_sympy_array(arr)
+
+
+def test_Tensor_equality_and_hash_are_structural():
+    x, y = symbols("x y")
+    t1 = Tensor([[x, y], [y, x]], config="lu")
+    t2 = Tensor([[x, y], [y, x]], config="lu")
+    t3 = Tensor([[x, y], [y, x]], config="ll")
+    assert t1 == t2 and hash(t1) == hash(t2)
+    assert not t1 == t3
+    # structurally equal tensors share a dict slot
+    assert len({t1: 0, t2: 1}) == 1
+
+
+# tests for NumericTensor
+
+
+def test_NumericTensor_storage_and_getitem():
+    t = NumericTensor([[1, 2], [3, 4]], config="ll")
+    assert isinstance(t.tensor(), np.ndarray)
+    assert t.tensor().dtype == np.float64
+    assert t[1, 0] == 3.0
+    assert t.order == 2 and t.config == "ll"
+
+
+def test_NumericTensor_change_config():
+    metric = NumericTensor(np.diag([1.0, -1.0, -1.0, -1.0]), config="ll")
+    v = NumericTensor([1.0, 2.0, 3.0, 4.0], config="u")
+    v_low = v.change_config("l", metric)
+    assert_allclose(v_low.tensor(), np.array([1.0, -2.0, -3.0, -4.0]))
+    # raising again recovers the original components
+    v_up = v_low.change_config("u", metric)
+    assert_allclose(v_up.tensor(), v.tensor())
+
+
 # tests for lambdify
 
 
@@ -187,6 +236,52 @@ def test_lambdify_on_schwarzschild_metric_without_args():
     assert_allclose(cmp_arr, result_arr, atol=1e-7, rtol=0.0)
 
 
+def test_lambdify_numba_backend_matches_numpy():
+    sch = schwarzschild_metric()
+    # values of t, r, theta, phi, a, c
+    vals = (0.0, 3.0, np.pi / 2, np.pi / 3, 2.0, 1.0)
+    args_np, f_np = sch.tensor_lambdify()
+    args_nb, f_nb = sch.tensor_lambdify(backend="numba")
+    assert args_np == args_nb
+    assert_allclose(
+        np.array(f_np(*vals), dtype=float), f_nb(*vals), atol=1e-10, rtol=0.0
+    )
+    # the compiled kernel is cached per backend and argument tuple
+    assert sch.tensor_lambdify(backend="numba")[1] is f_nb
+
+
+def test_lambdify_vectorized_matches_pointwise():
+    sch = schwarzschild_metric()
+    # batches of values of t, r, theta, phi, a, c
+    points = np.array(
+        [
+            [0.0, 3.0, np.pi / 2, np.pi / 3, 2.0, 1.0],
+            [1.0, 4.0, np.pi / 3, np.pi / 6, 2.0, 1.0],
+            [2.0, 5.0, np.pi / 4, np.pi / 2, 3.0, 2.0],
+        ]
+    )
+    args, f = sch.tensor_lambdify()
+    args_v, f_v = sch.tensor_lambdify_vectorized()
+    assert args == args_v
+    batched = f_v(*points.T)
+    assert batched.shape == (3, 4, 4)
+    for k, point in enumerate(points):
+        assert_allclose(batched[k], np.array(f(*point), dtype=float), atol=1e-10)
+
+
+def test_lambdify_scalar_tensor_all_backends():
+    # curvature invariants are scalar-stored tensors and get evaluated
+    # in integration loops through every lambdify entry point
+    x, y = symbols("x y")
+    t = BaseRelativityTensor(x ** 2 + y, (x, y), config="")
+    _, f_np = t.tensor_lambdify()
+    _, f_nb = t.tensor_lambdify(backend="numba")
+    assert_allclose(float(np.asarray(f_np(2.0, 1.0))), 5.0)
+    assert_allclose(float(f_nb(2.0, 1.0)), 5.0)
+    _, f_v = t.tensor_lambdify_vectorized()
+    assert_allclose(f_v(np.array([2.0, 3.0]), np.array([1.0, 0.0])), [5.0, 9.0])
+
+
 def test_lambdify_with_args():
     x, y = symbols("x y")
     T = BaseRelativityTensor([x + y, x], (x, y), config="l")
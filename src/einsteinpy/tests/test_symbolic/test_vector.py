@@ -1,5 +1,5 @@
 import numpy as np
-from sympy import cos, cosh, simplify, sinh, symbols
+from sympy import Array, Rational, cos, cosh, simplify, sinh, symbols
 
 from einsteinpy.symbolic import GenericVector, MetricTensor
 
@@ -27,6 +27,27 @@ def test_GenericVector_change_config_theoretical_test():
     assert simplify(covec.tensor()[1] - (b + a * cos(th))) == 0
 
 
+def test_GenericVector_change_config_numeric_fast_path():
+    # float components put change_config on the numpy fast path
+    syms = symbols("e1 e2")
+    metric = MetricTensor(np.diag([1.0, -2.0]).tolist(), syms, config="ll")
+    cnvec = GenericVector([3.0, 4.0], syms, config="u", parent_metric=metric)
+    covec = cnvec.change_config("l")
+    assert covec.tensor() == Array([3.0, -8.0])
+    # and raising again recovers the contravariant components
+    assert covec.change_config("u", metric).tensor() == Array([3.0, 4.0])
+
+
+def test_GenericVector_change_config_keeps_exact_rationals():
+    # exact components must not be degraded to float64-derived Floats
+    syms = symbols("e1 e2")
+    metric = MetricTensor([[Rational(1, 3), 0], [0, 3]], syms, config="ll")
+    cnvec = GenericVector([Rational(1, 3), Rational(2, 7)], syms, config="u")
+    covec = cnvec.change_config("l", metric)
+    assert covec.tensor()[0] == Rational(1, 9)
+    assert covec.tensor()[1] == Rational(6, 7)
+
+
 def test_GenericVector_check_ValueErrors():
     a, b = symbols("a b")
     syms = symbols("e1 e2")